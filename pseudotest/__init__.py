@@ -3,15 +3,33 @@ Pseudotest - YAML Regression Testing Framework
 
 A Python package for running regression tests defined in YAML format.
 Inspired by octopus/cephalopod naming for scientific software testing.
-"""
 
-from .cli_run import main
-from .cli_update import main as update_main
-from .formatting import Colors
-from .report import ReportWriter
-from .runner import PseudoTestRunner
+Public symbols are resolved lazily (PEP 562) so that ``import pseudotest``
+does not pay for the runner chain (ruamel.yaml, matchers, comparator)
+unless one of them is actually used.
+"""
 
 __version__ = "1.0.0"
 __author__ = "Kraken MD Team"
 
 __all__ = ["PseudoTestRunner", "ReportWriter", "Colors", "main", "update_main"]
+
+# Maps public names to the submodule and attribute that provide them.
+_LAZY_ATTRS = {
+    "PseudoTestRunner": ("runner", "PseudoTestRunner"),
+    "ReportWriter": ("report", "ReportWriter"),
+    "Colors": ("formatting", "Colors"),
+    "main": ("cli_run", "main"),
+    "update_main": ("cli_update", "main"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+
+    return getattr(import_module(f".{module_name}", __name__), attr_name)
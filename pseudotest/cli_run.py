@@ -13,7 +13,6 @@ import sys
 import traceback
 
 from pseudotest.exceptions import CliError, ExitCode
-from pseudotest.runner import PseudoTestRunner
 
 
 def setup_logging(verbosity_level: int) -> None:
@@ -76,6 +75,10 @@ def main(command_line_args: list[str] | None = None) -> int:
     )
     parsed_args = argument_parser.parse_args(command_line_args)
 
+    # Imported here so that --help/usage-error paths do not pay for the
+    # runner's transitive imports (ruamel.yaml, matchers, comparator)
+    from pseudotest.runner import PseudoTestRunner
+
     setup_logging(parsed_args.verbose)
     test_runner = PseudoTestRunner()
     return test_runner.run(
@@ -1,7 +1,9 @@
 """Value comparison and numeric precision analysis for pseudotest."""
 
 import logging
-import re
+import math
+import sys
+from functools import lru_cache
 from typing import Any
 
 from pseudotest.formatting import display_match_status, indent
@@ -10,10 +12,19 @@ from pseudotest.formatting import display_match_status, indent
 # Numeric precision
 # ---------------------------------------------------------------------------
 
+# Characters a decimal number may start with; used to reject non-numeric
+# input without the cost of a full float() parse.
+_NUMERIC_LEAD = "+-.0123456789"
 
+
+@lru_cache(maxsize=4096)
 def get_precision_from_string_format(value_str: str) -> float:
     """Get the precision/resolution from a numeric string representation.
 
+    Results are memoized: test suites emit the same numeric formats
+    (e.g. "0.00", "1.23e-04") over and over, so repeated calls reduce to
+    a dictionary lookup.
+
     Analyzes the string format of a number to determine the smallest
     representable difference using that format.
 
@@ -23,45 +34,78 @@ def get_precision_from_string_format(value_str: str) -> float:
     Returns:
         The precision implied by the string format, or 0.0 for non-numeric input.
     """
-    try:
-        float(value_str)
-    except (ValueError, TypeError):
+    if not value_str:
         return 0.0
 
+    # A single linear scan is cheaper than a regex or a validating float()
+    # parse for these short strings: locate the exponent marker and the
+    # decimal point, then derive the precision from digit counts alone.
     clean_str = value_str.strip()
+    if not clean_str or clean_str[0] not in _NUMERIC_LEAD:
+        return 0.0
 
-    # Handle scientific notation, including Fortran-style 'D' exponent
-    clean_str = re.sub(r"[dD]", "e", clean_str)
-    sci_match = re.match(r"^[+-]?(\d*\.?\d*)[eE]([+-]?\d+)$", clean_str)
-    if sci_match:
-        mantissa, exp_str = sci_match.groups()
-        exponent = int(exp_str)
+    exp_pos = clean_str.rfind("e")
+    if exp_pos < 0:
+        exp_pos = clean_str.rfind("E")
+    if exp_pos >= 0:
+        mantissa_end = exp_pos
+        try:
+            exponent = int(clean_str[exp_pos + 1 :])
+        except ValueError:
+            return 0.0
+    else:
+        mantissa_end = len(clean_str)
+        exponent = 0
 
-        if "." in mantissa:
-            decimal_digits = len(mantissa.split(".")[1])
-            mantissa_precision = 10 ** (-decimal_digits)
-        else:
-            mantissa_precision = 1.0
+    # Validate the mantissa: optional sign, digits, at most one decimal point.
+    # This also rejects Fortran-style 'D' exponents, which float() cannot
+    # parse either.
+    mantissa = clean_str[:mantissa_end]
+    body = mantissa[1:] if mantissa[:1] in ("+", "-") else mantissa
+    if not body.replace(".", "", 1).isdigit():
+        return 0.0
 
-        return mantissa_precision * (10**exponent)
+    dot_pos = clean_str.find(".", 0, mantissa_end)
+    decimal_digits = mantissa_end - dot_pos - 1 if dot_pos >= 0 else 0
 
-    # Handle regular numbers
-    if "." in clean_str:
-        _integer_part, decimal_part = clean_str.split(".", 1)
-        return 10 ** (-len(decimal_part))
-    else:
-        # Integer value, precision is 1
-        return 1.0
+    return 10.0 ** (exponent - decimal_digits)
 
 
 # ---------------------------------------------------------------------------
 # Numeric helpers
 # ---------------------------------------------------------------------------
 
+# Special float spellings accepted beyond what float() parses directly.
+_SPECIAL_FLOATS = frozenset({"nan", "inf", "-inf", "+inf"})
+
+# First characters a float()-parsable string can have: _NUMERIC_LEAD plus the
+# n/i of nan/inf(inity) spellings.
+_FLOAT_LEAD = frozenset(_NUMERIC_LEAD + "nNiI")
+
+
+@lru_cache(maxsize=1024)
+def _is_number_str(value: str) -> bool:
+    """Classify a string as float()-parsable, memoized per distinct string."""
+    # Pre-classify on the first character: ordinary text ("Converged", "yes")
+    # is rejected by a set lookup instead of the much costlier ValueError a
+    # failed float() parse would raise.
+    stripped = value.strip()
+    if not stripped or stripped[0] not in _FLOAT_LEAD:
+        return False
+    try:
+        float(stripped)
+        return True
+    except ValueError:
+        return stripped.lower() in _SPECIAL_FLOATS
+
 
 def is_number(value: str | float | int) -> bool:
     """Check if *value* represents a valid number including special float values.
 
+    String classification is memoized since the same reference values recur
+    across matches.  The type checks stay outside the cache so that unhashable
+    inputs (e.g. a broadcast list reference) return False instead of raising.
+
     Args:
         value: Value to test. Can be string, float, or int
 
@@ -69,17 +113,67 @@ def is_number(value: str | float | int) -> bool:
         True if *value* represents a valid number (including inf, -inf, nan),
         False otherwise.
     """
-    try:
-        float(value)
+    # Already-numeric inputs (e.g. reference values parsed from YAML) need no
+    # string round-trip
+    if isinstance(value, (int, float)):
         return True
-    except (ValueError, TypeError):
-        return str(value).lower() in ["nan", "inf", "-inf", "+inf"]
+    if not isinstance(value, str):
+        return False
+    return _is_number_str(value)
 
 
 # ---------------------------------------------------------------------------
 # Main comparison
 # ---------------------------------------------------------------------------
 
+# Separator line for the failure detail block, built once at import time.
+_DETAIL_BANNER = "-" * 40
+
+
+def _print_failure_details(
+    calculated_value: str,
+    reference_value: Any,
+    difference: float | None,
+    reference_float: float | None,
+    tolerance: float | None,
+    indent_level: int,
+) -> None:
+    """Emit the failure detail block for a mismatched comparison.
+
+    The details are accumulated in a list and flushed with a single
+    stdout write instead of one syscall per line.
+
+    Args:
+        calculated_value: Value calculated/extracted by the matcher
+        reference_value: Expected reference value it was compared against
+        difference: Absolute difference for numeric comparisons, or None
+                    for string comparisons
+        reference_float: Parsed reference value, or None for string comparisons
+        tolerance: Optional numerical tolerance used for the comparison
+        indent_level: Nesting level for output display
+    """
+    detail_indent = indent(indent_level + 1)
+    separator = detail_indent + _DETAIL_BANNER
+    detail_lines = [separator]
+    if difference is not None:
+        abs_reference = abs(reference_float)
+        detail_lines.append(f"{detail_indent}Calculated value : {calculated_value}")
+        detail_lines.append(f"{detail_indent}Reference value  : {reference_value}")
+        detail_lines.append(f"{detail_indent}Difference       : {difference}")
+        if abs_reference > 1e-10:
+            rel_diff = difference / abs_reference * 100.0
+            detail_lines.append(f"{detail_indent}Deviation [%]    : {rel_diff:.6f}")
+        if tolerance:
+            detail_lines.append(f"{detail_indent}Tolerance        : {tolerance}")
+            if abs_reference > 1e-10:
+                rel_tol = tolerance / abs_reference * 100.0
+                detail_lines.append(f"{detail_indent}Tolerance [%]    : {rel_tol:.6f}")
+    else:
+        detail_lines.append(f"{detail_indent}Calculated value : '{calculated_value}'")
+        detail_lines.append(f"{detail_indent}Expected value   : '{reference_value}'")
+    detail_lines.append(separator)
+    sys.stdout.write("\n".join(detail_lines) + "\n")
+
 
 def match_compare_result(
     match_name: str,
@@ -87,6 +181,7 @@ def match_compare_result(
     reference_value: Any,
     tolerance: float | None = None,
     indent_level: int = 2,
+    quiet: bool = False,
 ) -> bool:
     """Compare *calculated_value* against *reference_value* and display results.
 
@@ -102,50 +197,69 @@ def match_compare_result(
         tolerance: Optional numerical tolerance for floating point comparison.
                   If None, exact equality is required for numbers.
         indent_level: Nesting level for output display
+        quiet: Skip the per-match status line for passing matches.  Useful
+               for batch runs where only failures are of interest.
 
     Returns:
         True if values match within tolerance (or exactly for strings),
         False otherwise.
     """
-    is_numeric_comparison = is_number(str(reference_value)) and is_number(calculated_value)
+    # Fast path: identical string representations always compare equal.  Most
+    # matches pass, so this skips all numeric parsing for the common case.
+    if calculated_value == str(reference_value):
+        if not quiet:
+            display_match_status(match_name, True, indent_level)
+        return True
+
+    # Parse both values once; the floats are reused for the difference and
+    # the deviation/tolerance-percent display below.
+    try:
+        calculated_float = float(calculated_value)
+        reference_float = float(reference_value)
+        is_numeric_comparison = True
+    except (ValueError, TypeError):
+        is_numeric_comparison = False
+
     if is_numeric_comparison:
-        difference = abs(float(calculated_value) - float(reference_value))
-        success = difference <= tolerance if tolerance else difference == 0.0
+        if tolerance:
+            success = math.isclose(calculated_float, reference_float, rel_tol=0.0, abs_tol=tolerance)
+        else:
+            success = calculated_float == reference_float
+        # The difference is only needed for the failure display
+        difference = None if success else abs(calculated_float - reference_float)
 
         # Check if tolerance is smaller than the effective precision
         if tolerance and tolerance > 0:
             effective_precision = get_precision_from_string_format(calculated_value)
             if tolerance < effective_precision:
-                detail_indent = indent(indent_level + 1)
+                # %-style arguments defer formatting until the record is emitted
                 logging.warning(
-                    f"{detail_indent}Tolerance {tolerance} is smaller than the effective precision "
-                    f"{effective_precision} of calculated value '{calculated_value}'. Consider using "
-                    f"tolerance >= {effective_precision:.2e}"
+                    "%sTolerance %s is smaller than the effective precision "
+                    "%s of calculated value '%s'. Consider using tolerance >= %.2e",
+                    indent(indent_level + 1),
+                    tolerance,
+                    effective_precision,
+                    calculated_value,
+                    effective_precision,
                 )
     else:
         success = str(calculated_value) == str(reference_value)
         difference = None
 
-    display_match_status(match_name, success, indent_level)
-
-    if not success:
-        detail_indent = indent(indent_level + 1)
-        print(f"{detail_indent}" + "-" * 40)
-        if difference is not None:
-            print(f"{detail_indent}Calculated value : {calculated_value}")
-            print(f"{detail_indent}Reference value  : {reference_value}")
-            print(f"{detail_indent}Difference       : {difference}")
-            if abs(float(reference_value)) > 1e-10:
-                rel_diff = abs(float(calculated_value) - float(reference_value)) / abs(float(reference_value)) * 100.0
-                print(f"{detail_indent}Deviation [%]    : {rel_diff:.6f}")
-            if tolerance:
-                print(f"{detail_indent}Tolerance        : {tolerance}")
-                if abs(float(reference_value)) > 1e-10:
-                    rel_tol = tolerance / abs(float(reference_value)) * 100.0
-                    print(f"{detail_indent}Tolerance [%]    : {rel_tol:.6f}")
-        else:
-            print(f"{detail_indent}Calculated value : '{calculated_value}'")
-            print(f"{detail_indent}Expected value   : '{reference_value}'")
-        print(f"{detail_indent}" + "-" * 40)
+    if success:
+        # Keep the success path allocation-free: no failure strings are ever
+        # built when the comparison passes.
+        if not quiet:
+            display_match_status(match_name, True, indent_level)
+        return True
 
-    return success
+    display_match_status(match_name, False, indent_level)
+    _print_failure_details(
+        calculated_value,
+        reference_value,
+        difference,
+        reference_float if is_numeric_comparison else None,
+        tolerance,
+        indent_level,
+    )
+    return False
@@ -14,6 +14,7 @@ preserving comments and formatting.
 
 import logging
 import math
+from bisect import bisect_right
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +28,10 @@ from pseudotest.test_config import yaml
 # Tolerance computation
 # ---------------------------------------------------------------------------
 
+# Powers of ten covering the magnitudes seen in practice.  Bisecting this
+# table yields the decimal magnitude without a transcendental log10 call.
+_POW10 = tuple(10.0**i for i in range(-30, 31))
+
 
 def compute_tolerance(difference: float) -> float:
     """Return a tolerance that covers *difference* with a 10 % safety margin.
@@ -42,7 +47,10 @@ def compute_tolerance(difference: float) -> float:
     if difference == 0:
         return 0.0
     padded = difference * 1.1
-    magnitude = math.floor(math.log10(padded))
+    if _POW10[0] <= padded < _POW10[-1]:
+        magnitude = bisect_right(_POW10, padded) - 31  # _POW10[31] == 10**1
+    else:
+        magnitude = math.floor(math.log10(padded))
     factor = 10 ** (magnitude - 1)
     raw = math.ceil(padded / factor) * factor
     ndigits = -(magnitude - 1)
@@ -81,6 +89,15 @@ def _cast_to_reference_type(value_str: str, reference: Any) -> Any:
         return value_str
 
 
+# Format attributes extracted from ScalarFloat templates, keyed on object
+# identity.  Many reference values in a YAML file share the same template,
+# so this skips the repeated getattr reflection.  Each entry pins the
+# template itself so its id cannot be recycled while the entry exists, and
+# insertion-order eviction keeps the table bounded across configs.
+_TEMPLATE_FMT_CACHE: dict[int, tuple[ScalarFloat, int, int]] = {}
+_TEMPLATE_FMT_CACHE_MAX = 256
+
+
 def _make_scalar_float(value: float, template: ScalarFloat) -> ScalarFloat:
     """Create a ``ScalarFloat`` with *value* inheriting format from *template*.
 
@@ -89,12 +106,19 @@ def _make_scalar_float(value: float, template: ScalarFloat) -> ScalarFloat:
     ``_width`` (total string length) are recomputed so the new number
     renders correctly regardless of how many integer digits it has.
     """
-    t_prec = getattr(template, "_prec", 0)
-    t_width = getattr(template, "_width", 0)
-    m_lead0 = getattr(template, "_m_lead0", 0)
-
-    # decimal_places = characters after '.' in the template representation
-    decimal_places = t_width - t_prec - 1  # subtract chars-before-dot and dot
+    cached = _TEMPLATE_FMT_CACHE.get(id(template))
+    if cached is None:
+        t_prec = getattr(template, "_prec", 0)
+        t_width = getattr(template, "_width", 0)
+        m_lead0 = getattr(template, "_m_lead0", 0)
+
+        # decimal_places = characters after '.' in the template representation
+        decimal_places = t_width - t_prec - 1  # subtract chars-before-dot and dot
+        if len(_TEMPLATE_FMT_CACHE) >= _TEMPLATE_FMT_CACHE_MAX:
+            _TEMPLATE_FMT_CACHE.pop(next(iter(_TEMPLATE_FMT_CACHE)))
+        _TEMPLATE_FMT_CACHE[id(template)] = (template, m_lead0, decimal_places)
+    else:
+        _, m_lead0, decimal_places = cached
 
     # New prec = characters before the decimal point in the new value
     int_part = str(int(abs(value))) if abs(value) >= 1 else "0"
@@ -115,23 +139,25 @@ def _make_scalar_float(value: float, template: ScalarFloat) -> ScalarFloat:
 # Per-match update application
 # ---------------------------------------------------------------------------
 
-MatchResult = tuple[int, bool, str | None, Any]
-"""``(broadcast_index, success, calculated_value, param_set)``."""
-
 
 def apply_match_updates(
     match_def: dict[str, Any],
-    results: list[MatchResult],
-    total: int,
+    successes: list[bool],
+    calculated_values: list[str | None],
+    param_sets: list[Any],
     mode: str,
 ) -> bool:
     """Apply tolerance or reference updates to *match_def* for failed matches.
 
+    Results are passed as parallel lists indexed by broadcast position, so
+    the dominant skip-passing-matches filter touches only the fields it
+    needs instead of unpacking a tuple per element.
+
     Args:
         match_def: The raw YAML dict for this match entry (modified in-place).
-        results: One ``(index, success, calculated_value, param_set)``
-                 tuple per broadcast element.
-        total: Total number of broadcast elements (``len(results)``).
+        successes: Per-broadcast-element match outcome.
+        calculated_values: Per-broadcast-element calculated value.
+        param_sets: Per-broadcast-element parameter set.
         mode: ``"tolerance"`` or ``"reference"``.
 
     Returns:
@@ -141,21 +167,25 @@ def apply_match_updates(
     if match_def.get("protected", False):
         return False
 
-    # Skip matches whose reference key is marked non-updatable
-    ref_key = next((k for k in REFERENCE_KEYS if k in match_def), None)
+    # Skip matches whose reference key is marked non-updatable.  The dict
+    # keys view is set-like, so the intersection runs in C; the key is
+    # computed once here and shared by the per-element helpers.
+    ref_key = next(iter(REFERENCE_KEYS & match_def.keys()), None)
     if ref_key in NON_UPDATABLE_KEYS:
         return False
 
+    total = len(successes)
     modified = False
-    for index, success, calculated_value, param_set in results:
+    for index, success in enumerate(successes):
         # Skip passing matches and extraction failures
+        calculated_value = calculated_values[index]
         if success or calculated_value is None:
             continue
 
         if mode == "tolerance":
-            modified |= _update_tolerance(match_def, index, total, calculated_value, param_set)
+            modified |= _update_tolerance(match_def, index, total, calculated_value, param_sets[index], ref_key)
         elif mode == "reference":
-            modified |= _update_reference(match_def, index, total, calculated_value)
+            modified |= _update_reference(match_def, index, total, calculated_value, ref_key)
 
     return modified
 
@@ -166,17 +196,26 @@ def _update_tolerance(
     total: int,
     calculated_value: str,
     param_set: Any,
+    ref_key: str | None = None,
 ) -> bool:
     """Set or increase the ``tol`` key so the match would pass."""
-    # Locate the reference key in this parameter set
-    ref_key = next((k for k in REFERENCE_KEYS if k in param_set), None)
+    # Fall back to searching the parameter set when the reference value is
+    # inherited from an enclosing scope rather than defined on the match itself
+    if ref_key is None:
+        ref_key = next(iter(REFERENCE_KEYS & param_set.keys()), None)
     if ref_key is None:
         return False
 
     reference = param_set[ref_key]
 
-    # Tolerance only makes sense for numeric comparisons
-    if not (is_number(str(reference)) and is_number(calculated_value)):
+    # Identical string representations mean zero difference; skip the
+    # numeric parse entirely
+    if calculated_value == str(reference):
+        return False
+
+    # Tolerance only makes sense for numeric comparisons.  Booleans are
+    # excluded explicitly since is_number() takes them on its numeric fast path.
+    if isinstance(reference, bool) or not (is_number(reference) and is_number(calculated_value)):
         return False
 
     difference = abs(float(calculated_value) - float(reference))
@@ -204,9 +243,11 @@ def _update_reference(
     index: int,
     total: int,
     calculated_value: str,
+    ref_key: str | None = None,
 ) -> bool:
     """Replace a reference value with the calculated one."""
-    ref_key = next((k for k in REFERENCE_KEYS if k in match_def), None)
+    if ref_key is None:
+        ref_key = next(iter(REFERENCE_KEYS & match_def.keys()), None)
     if ref_key is None:
         return False
 
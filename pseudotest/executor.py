@@ -6,14 +6,17 @@ and capturing output.
 Accepts an ``OutputFormatter`` via constructor so that presentation can be swapped or mocked independently.
 """
 
+import functools
 import logging
+import multiprocessing
 import os
 import shutil
+import stat
 import subprocess
 import time
 from collections import ChainMap
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any
 
 from pseudotest.exceptions import UsageError
 from pseudotest.formatting import OutputFormatter
@@ -34,6 +37,88 @@ _MPI_NP_FLAG: dict[str, str] = {
 
 _DEFAULT_NP_FLAG = "-np"
 
+# os.copy_file_range exists on Linux 4.5+; probed once at import time.
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _copy_file(source_path: Path | str, dest_path: Path | str) -> None:
+    """Copy file bytes, preferring the in-kernel ``copy_file_range``.
+
+    On reflink-capable filesystems (btrfs, XFS) copy_file_range shares
+    extents copy-on-write, turning the copy into a metadata-only operation;
+    elsewhere it still avoids bouncing the data through userspace.  Any
+    failure (cross-device copies, unsupported filesystems) falls back to
+    :func:`shutil.copyfile`.
+    """
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            src_fd = os.open(source_path, os.O_RDONLY)
+            try:
+                dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    remaining = os.fstat(src_fd).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        return
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        except OSError:
+            pass
+    shutil.copyfile(source_path, dest_path)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_executable_cached(exec_path_str: str, executable_name: str) -> Path:
+    """Validate and resolve an executable path, cached by location and name.
+
+    Only successful resolutions are cached (``lru_cache`` does not memoize
+    raised exceptions).  Callers that create or remove executables at
+    runtime — e.g. tests — can invalidate with ``cache_clear()``.
+    """
+    executable_path = Path(exec_path_str) / executable_name
+
+    # One os.stat answers both the is-a-regular-file and the permission
+    # check, instead of the separate stat calls is_file() + stat() would make.
+    try:
+        mode = os.stat(executable_path).st_mode  # noqa: PTH116
+    except OSError:
+        mode = None
+    if mode is None or not stat.S_ISREG(mode):
+        raise FileNotFoundError(f"Executable '{executable_name}' not available at {executable_path}")
+    if not (mode & 0o111):
+        raise PermissionError(f"Executable '{executable_name}' is not executable")
+
+    # Hint the kernel to pull the binary into page cache ahead of the first
+    # execve — resolution is cached, so the hint fires once per executable.
+    # Purely advisory: any failure is ignored.
+    if hasattr(os, "posix_fadvise"):
+        try:
+            fd = os.open(executable_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    return executable_path if executable_path.is_absolute() else Path.cwd() / executable_path
+
+
+def _run_one(request: tuple) -> tuple[Path, bool, float]:
+    """Run a single test request in a worker process.
+
+    *request* holds the positional arguments of :meth:`TestExecutor.execute`.
+    This lives at module level so the multiprocessing machinery can pickle it.
+    """
+    success, elapsed = TestExecutor().execute(*request)
+    return request[1], success, elapsed
+
 
 class TestExecutor:
     """Execute a single test input in a temporary directory.
@@ -44,6 +129,7 @@ class TestExecutor:
 
     def __init__(self, output_formatter: OutputFormatter | None = None):
         self.output_formatter = output_formatter or OutputFormatter()
+        self._pool: multiprocessing.pool.Pool | None = None
 
     # --------------------------------------------------------------------- #
     # Public API
@@ -107,6 +193,35 @@ class TestExecutor:
             timeout,
         )
 
+    def execute_many(self, requests: list[tuple]) -> list[tuple[Path, bool, float]]:
+        """Run several test requests in parallel worker processes.
+
+        The worker pool is created on first use and kept alive across calls,
+        so repeated invocations do not pay the process start-up cost again.
+        Call :meth:`close` when done (garbage collection also closes it).
+
+        Args:
+            requests: List of positional-argument tuples for :meth:`execute`.
+
+        Returns:
+            List of ``(input_file, success, elapsed_seconds)`` tuples in
+            completion order.
+        """
+        if self._pool is None:
+            workers = max(1, (os.cpu_count() or 2) - 2)
+            self._pool = multiprocessing.get_context("forkserver").Pool(workers)
+        return list(self._pool.imap_unordered(_run_one, requests, chunksize=4))
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was created."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __del__(self):
+        self.close()
+
     # --------------------------------------------------------------------- #
     # Private helpers
     # --------------------------------------------------------------------- #
@@ -116,18 +231,14 @@ class TestExecutor:
         input_config: ChainMap[str, Any],
         exec_path: Path,
     ) -> Path:
-        """Validate and resolve the executable path."""
-
-        executable_name = input_config["Executable"]
-        executable_path = Path(exec_path) / executable_name
+        """Validate and resolve the executable path.
 
-        if not executable_path.is_file():
-            raise FileNotFoundError(f"Executable '{executable_name}' not available at {executable_path}")
-        if not (executable_path.stat().st_mode & 0o111):
-            raise PermissionError(f"Executable '{executable_name}' is not executable")
+        Resolution is memoized by ``(exec_path, name)``: the same executable
+        is typically used for every input of a test, and it does not change
+        mid-run, so the stat-based checks are paid once per executable.
+        """
 
-        resolved = executable_path if executable_path.is_absolute() else Path.cwd() / executable_path
-        return resolved
+        return _resolve_executable_cached(str(exec_path), input_config["Executable"])
 
     @staticmethod
     def _prepare_files(
@@ -143,26 +254,42 @@ class TestExecutor:
         Returns the working name of the input file inside *temp_dir*.
         """
 
+        # Capture the test directory contents in a single scandir pass so the
+        # input and extra files can be checked without one stat syscall each.
+        # Files in subdirectories fall back to an explicit exists() probe.
+        try:
+            with os.scandir(test_dir) as entries:
+                available_names = {entry.name for entry in entries}
+        except OSError:
+            available_names = set()
+
         source_input_path = test_dir / input_file
-        if not source_input_path.exists():
+        if str(input_file) not in available_names and not source_input_path.exists():
             raise FileNotFoundError(f"Input file not found: {source_input_path}")
 
         if input_method == "rename" and rename_target:
-            shutil.copy2(source_input_path, temp_dir / rename_target)
-            logging.debug(f"Copied input file: {input_file} -> {rename_target}")
             working_input_name = rename_target
+            dest_name = rename_target
         else:
-            shutil.copy2(source_input_path, temp_dir)
-            logging.debug(f"Copied input file: {input_file}")
             working_input_name = str(input_file)
-
+            dest_name = source_input_path.name
+
+        # Validate everything up front, then stage all files in one coalesced
+        # loop.  Only the bytes are needed, not the source metadata, so the
+        # copy goes through _copy_file (copy_file_range with a copyfile
+        # fallback).  Destinations are joined as plain strings to avoid one
+        # Path allocation per staged file.
+        temp_dir_str = os.fspath(temp_dir)
+        copy_pairs = [(source_input_path, os.path.join(temp_dir_str, dest_name))]  # noqa: PTH118
         for extra_file in extra_files:
             source_extra_path = test_dir / extra_file
-            if source_extra_path.exists():
-                shutil.copy2(source_extra_path, temp_dir)
-                logging.debug(f"Copied extra file: {extra_file}")
-            else:
+            if extra_file not in available_names and not source_extra_path.exists():
                 raise FileNotFoundError(f"Extra file not found: {source_extra_path}")
+            copy_pairs.append((source_extra_path, os.path.join(temp_dir_str, source_extra_path.name)))  # noqa: PTH118
+
+        for source_path, dest_path in copy_pairs:
+            _copy_file(source_path, dest_path)
+            logging.debug("Copied file: %s -> %s", source_path.name, os.path.basename(dest_path))  # noqa: PTH119
 
         return working_input_name
 
@@ -173,8 +300,14 @@ class TestExecutor:
         input_method: str,
         temp_dir: Path,
         input_config: ChainMap[str, Any] | None = None,
-    ) -> tuple[list[str | Path], TextIO | None]:
-        """Build the subprocess command and optional stdin file handle.
+    ) -> tuple[list[str], int | None]:
+        """Build the subprocess command and optional stdin file descriptor.
+
+        The command is assembled from plain strings so that subprocess does
+        not have to fspath() Path objects per launch.  The stdin file is
+        opened as a raw descriptor rather than a Python file object: the
+        child process only needs the fd, so there is no point paying for a
+        ``TextIOWrapper`` and its decoder per test.
 
         When the ``MPIEXEC`` environment variable is set, the command is
         prefixed with the MPI launcher and the appropriate processor-count
@@ -183,18 +316,21 @@ class TestExecutor:
         :data:`_MPI_NP_FLAG`; unrecognised launchers default to ``-np``.
         """
 
+        executable_str = os.fspath(resolved_executable)
+
         if input_method == "argument":
-            command_args: list[str | Path] = [resolved_executable, working_input_name]
+            command_args = [executable_str, working_input_name]
             stdin_file = None
-            logging.info(f"Executing: {resolved_executable} {working_input_name}")
+            logging.info("Executing: %s %s", executable_str, working_input_name)
         elif input_method == "stdin":
-            command_args = [resolved_executable]
-            stdin_file = (temp_dir / working_input_name).open("r")
-            logging.info(f"Executing: {resolved_executable} < {working_input_name}")
+            command_args = [executable_str]
+            input_path = os.path.join(os.fspath(temp_dir), working_input_name)  # noqa: PTH118
+            stdin_file = os.open(input_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+            logging.info("Executing: %s < %s", executable_str, working_input_name)
         elif input_method == "rename":
-            command_args = [resolved_executable]
+            command_args = [executable_str]
             stdin_file = None
-            logging.info(f"Executing: {resolved_executable} (with {working_input_name} in working directory)")
+            logging.info("Executing: %s (with %s in working directory)", executable_str, working_input_name)
         else:
             raise UsageError(f"Unknown input method: {input_method}")
 
@@ -207,62 +343,96 @@ class TestExecutor:
             launcher_name = Path(mpiexec).name
             np_flag = _MPI_NP_FLAG.get(launcher_name, _DEFAULT_NP_FLAG)
             command_args = [mpiexec, np_flag, str(processors), *command_args]
-            logging.info(f"MPI execution: {mpiexec} {np_flag} {processors}")
+            logging.info("MPI execution: %s %s %s", mpiexec, np_flag, processors)
 
         return command_args, stdin_file
 
+    @staticmethod
+    def _launch(
+        command_args: list[str],
+        temp_dir_str: str,
+        stdin_file: int | None,
+        timeout: int,
+    ) -> tuple[int, int]:
+        """Run the child process and return ``(returncode, stderr_size)``.
+
+        The parent never writes to the capture files itself, so raw
+        descriptors are enough — no TextIOWrapper or buffer per stream.
+        The fstat on the still-open stderr descriptor tells the caller
+        whether there is anything to re-read later, without another
+        open+read.
+        """
+        out_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+        # Both opens happen inside the try so that a failed stderr open
+        # still closes the already-open stdout descriptor.
+        stdout_fd = stderr_fd = None
+        try:
+            stdout_fd = os.open(os.path.join(temp_dir_str, "stdout"), out_flags, 0o644)  # noqa: PTH118
+            stderr_fd = os.open(os.path.join(temp_dir_str, "stderr"), out_flags, 0o644)  # noqa: PTH118
+            process_result = subprocess.run(
+                command_args,
+                cwd=temp_dir_str,
+                stdout=stdout_fd,
+                stderr=stderr_fd,
+                stdin=stdin_file,
+                text=True,
+                timeout=timeout,
+            )
+            return process_result.returncode, os.fstat(stderr_fd).st_size
+        finally:
+            if stdout_fd is not None:
+                os.close(stdout_fd)
+            if stderr_fd is not None:
+                os.close(stderr_fd)
+
     def _run_subprocess(
         self,
-        command_args: list[str | Path],
-        stdin_file: TextIO | None,
+        command_args: list[str],
+        stdin_file: int | None,
         temp_dir: Path,
         working_input_name: str,
         input_file: Path,
         expected_failure: bool,
         timeout: int,
     ) -> tuple[bool, float]:
-        """Launch the subprocess and return ``(success, elapsed)``."""
+        """Launch the subprocess and return ``(success, elapsed_seconds)``.
+
+        Elapsed time is measured with :func:`time.monotonic_ns`, which is
+        immune to wall-clock adjustments during the run.
+        """
 
         execution_success = False
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            with (temp_dir / "stdout").open("w") as stdout_fh, (temp_dir / "stderr").open("w") as stderr_fh:
-                process_result = subprocess.run(
-                    command_args,
-                    cwd=temp_dir,
-                    stdout=stdout_fh,
-                    stderr=stderr_fh,
-                    stdin=stdin_file,
-                    text=True,
-                    timeout=timeout,
-                )
-            execution_success = process_result.returncode == 0
+            returncode, stderr_size = self._launch(command_args, os.fspath(temp_dir), stdin_file, timeout)
+            execution_success = returncode == 0
 
             if not execution_success:
-                logging.debug(f"Executable failed with exit code {process_result.returncode}")
+                logging.debug("Executable failed with exit code %s", returncode)
                 if not expected_failure:
                     self.output_formatter.print_execution_output(temp_dir, str(input_file))
 
-            stderr_content = (temp_dir / "stderr").read_text(errors="replace")
-            if stderr_content and execution_success:
-                logging.debug(f"STDERR: {stderr_content}")
+            # Only pay for the read+decode when the DEBUG log would show it.
+            if stderr_size and execution_success and logging.getLogger().isEnabledFor(logging.DEBUG):
+                stderr_content = (temp_dir / "stderr").read_text(errors="replace")
+                logging.debug("STDERR: %s", stderr_content)
 
         except subprocess.TimeoutExpired:
-            logging.debug(f"Test execution timed out after {timeout} seconds")
+            logging.debug("Test execution timed out after %s seconds", timeout)
             execution_success = False
             if not expected_failure:
                 self.output_formatter.print_execution_output(temp_dir, str(input_file))
         except Exception as e:
-            logging.debug(f"Test execution failed: {e}")
+            logging.debug("Test execution failed: %s", e)
             execution_success = False
             if not expected_failure:
                 self.output_formatter.print_execution_output(temp_dir, str(input_file))
         finally:
-            if stdin_file:
-                stdin_file.close()
+            if stdin_file is not None:
+                os.close(stdin_file)
             else:
                 (temp_dir / working_input_name).unlink(missing_ok=True)
 
-        execution_time = time.time() - start_time
+        execution_time = (time.monotonic_ns() - start_ns) * 1e-9
         return execution_success, execution_time
@@ -8,13 +8,21 @@ INDENT_STEP = 2
 STATUS_COLUMN = 54
 
 
+# Only a handful of nesting levels occur in practice, so the indentation
+# strings are built once and reused.
+_INDENT_CACHE: dict[int, str] = {}
+
+
 def indent(level: int) -> str:
     """Return an indentation string for the given nesting *level*.
 
     Level 0 produces no indentation; each subsequent level adds
     :data:`INDENT_STEP` spaces.
     """
-    return " " * (INDENT_STEP * level)
+    cached = _INDENT_CACHE.get(level)
+    if cached is None:
+        cached = _INDENT_CACHE[level] = " " * (INDENT_STEP * level)
+    return cached
 
 
 class Colors:
@@ -22,8 +30,17 @@ class Colors:
 
     Automatically detects if stdout is a TTY and disables colors if not.
     This ensures clean output when redirecting to files or pipes.
+
+    The disabled codes are class-level defaults, so constructing an
+    instance only writes attributes when stdout actually is a TTY.
     """
 
+    # No colors for non-TTY output (files, pipes, etc.)
+    BLUE = ""
+    RED = ""
+    GREEN = ""
+    RESET = ""
+
     def __init__(self):
         """Initialize color codes based on TTY detection."""
         if sys.stdout.isatty():
@@ -31,12 +48,26 @@ class Colors:
             self.RED = "\033[31m"
             self.GREEN = "\033[32m"
             self.RESET = "\033[0m"
-        else:
-            # No colors for non-TTY output (files, pipes, etc.)
-            self.BLUE = ""
-            self.RED = ""
-            self.GREEN = ""
-            self.RESET = ""
+
+
+# Shared Colors instance: the TTY state does not change during a run, so the
+# isatty() probe is paid once at import time instead of per status line.
+# The two possible status markers are likewise formatted only once.
+_COLORS = Colors()
+_STATUS_OK = f"[{_COLORS.GREEN} OK {_COLORS.RESET}]"
+_STATUS_FAIL = f"[{_COLORS.RED}FAIL{_COLORS.RESET}]"
+
+
+def reset_colors() -> None:
+    """Re-detect the TTY state and refresh the shared :class:`Colors` instance.
+
+    Only needed when ``sys.stdout`` has been replaced after import, e.g. in
+    tests or when embedding pseudotest with redirected output.
+    """
+    global _COLORS, _STATUS_OK, _STATUS_FAIL
+    _COLORS = Colors()
+    _STATUS_OK = f"[{_COLORS.GREEN} OK {_COLORS.RESET}]"
+    _STATUS_FAIL = f"[{_COLORS.RED}FAIL{_COLORS.RESET}]"
 
 
 def display_match_status(match_name: str, success: bool, indent_level: int = 2) -> None:
@@ -47,13 +78,8 @@ def display_match_status(match_name: str, success: bool, indent_level: int = 2)
         success: Whether the match succeeded
         indent_level: Nesting level (each level = :data:`INDENT_STEP` spaces)
     """
-    colors = Colors()
     prefix = indent(indent_level)
-    name_width = STATUS_COLUMN - len(prefix)
-
-    status_text = f"[{colors.GREEN} OK {colors.RESET}]" if success else f"[{colors.RED}FAIL{colors.RESET}]"
-
-    print(f"{prefix}{match_name:<{name_width}} {status_text}")
+    print(prefix + match_name.ljust(STATUS_COLUMN - len(prefix)) + " " + (_STATUS_OK if success else _STATUS_FAIL))
 
 
 class OutputFormatter:
@@ -65,7 +91,7 @@ class OutputFormatter:
     """
 
     def __init__(self, colors: Colors | None = None):
-        self.colors = colors or Colors()
+        self.colors = colors or _COLORS
 
     def print_execution_output(self, temp_dir: Path, input_file: str) -> None:
         """Print stdout and stderr output from a failed execution.
@@ -102,7 +128,7 @@ class OutputFormatter:
                         # Inform user when file is empty
                         print(f"\n{self.colors.RED}=== {output_name} from {input_file} is empty ==={self.colors.RESET}")
                 except Exception as e:
-                    logging.debug(f"Failed to read {output_name} file: {e}")
+                    logging.debug("Failed to read %s file: %s", output_name, e)
             else:
                 # Inform user when file doesn't exist
                 print(f"\n{self.colors.RED}=== {output_name} from {input_file} does not exist ==={self.colors.RESET}")
@@ -8,8 +8,11 @@ New match types can be added by registering a handler function via ``register_ma
 
 import logging
 import math
-from collections import ChainMap
-from collections.abc import Callable
+import mmap
+import os
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +20,7 @@ from pseudotest.comparator import match_compare_result
 from pseudotest.exceptions import UsageError
 from pseudotest.value_extractors import (
     extract_column_from_line,
+    extract_field,
     extract_field_from_line,
     find_pattern_line,
     get_target_line,
@@ -26,8 +30,8 @@ from pseudotest.value_extractors import (
 # Handler registry
 # =============================================================================
 
-MatchPredicate = Callable[[ChainMap[str, Any]], bool]
-MatchHandler = Callable[[Path, ChainMap[str, Any]], tuple[str | None, Any]]
+MatchPredicate = Callable[[Mapping[str, Any]], bool]
+MatchHandler = Callable[[Path, Mapping[str, Any]], tuple[str | None, Any]]
 
 _MATCH_HANDLERS: list[tuple[MatchPredicate, MatchHandler]] = []
 
@@ -55,7 +59,7 @@ def register_match_handler(
     Args:
         predicate: A callable ``(params) -> bool`` that returns True when
                    *handler* should process this match.
-        handler: A callable ``(Path, ChainMap) -> (str | None, Any)``
+        handler: A callable ``(Path, Mapping) -> (str | None, Any)``
                  that computes the (calculated, reference) value pair.
         keys: Parameter keys recognised by this handler
               (added to :data:`RESERVED_KEYS`).
@@ -84,7 +88,7 @@ def register_match_handler(
 # =============================================================================
 
 
-def handle_directory_matches(dirpath: Path, params: ChainMap[str, Any]) -> tuple[str | None, Any]:
+def handle_directory_matches(dirpath: Path, params: Mapping[str, Any]) -> tuple[str | None, Any]:
     """Handle directory-based matches and return calculated and reference values.
 
     Supports two types of directory operations:
@@ -102,31 +106,36 @@ def handle_directory_matches(dirpath: Path, params: ChainMap[str, Any]) -> tuple
         UsageError: If neither 'file_is_present' nor 'count_files' is provided,
                    or if 'file_is_present' parameter is not a string
     """
-    if not dirpath.is_dir():
-        calculated_value = "False"
-        reference_value = "True"
-
-    elif "file_is_present" in params:
-        filename = params["file_is_present"]
-        if not isinstance(filename, str):
-            raise UsageError("file_is_present parameter must be a string")
-
-        file_path = dirpath / filename
-        calculated_value = "False" if not file_path.is_file() else "True"
-        reference_value = "True"
-
-    elif "count_files" in params:
-        file_count = sum(1 for item in dirpath.iterdir() if item.is_file())
-        calculated_value = str(file_count)
-        reference_value = params["count_files"]
+    # One scandir pass covers both the existence check and the per-entry
+    # queries: DirEntry.is_file() answers from the cached dirent type on most
+    # filesystems, so no extra stat syscall per entry.  Symlinks are still
+    # followed (the pathlib behaviour this replaced), so a symlink to a
+    # regular file counts as present.
+    try:
+        with os.scandir(dirpath) as entries:
+            if "file_is_present" in params:
+                filename = params["file_is_present"]
+                if not isinstance(filename, str):
+                    raise UsageError("file_is_present parameter must be a string")
+
+                if os.sep in filename:
+                    # Nested targets are not in this directory's listing
+                    present = (dirpath / filename).is_file()
+                else:
+                    present = any(entry.name == filename and entry.is_file() for entry in entries)
+                return ("True" if present else "False"), "True"
+
+            if "count_files" in params:
+                file_count = sum(1 for entry in entries if entry.is_file())
+                return str(file_count), params["count_files"]
 
-    else:
         raise UsageError("Directory parameter requires either 'file_is_present' or 'count_files'")
 
-    return calculated_value, reference_value
+    except (FileNotFoundError, NotADirectoryError):
+        return "False", "True"
 
 
-def handle_file_matches(filepath: Path, params: ChainMap[str, Any]) -> tuple[str | None, Any]:
+def handle_file_matches(filepath: Path, params: Mapping[str, Any]) -> tuple[str | None, Any]:
     """Handle file-based matches (size) and return calculated and reference values.
 
     Args:
@@ -136,17 +145,18 @@ def handle_file_matches(filepath: Path, params: ChainMap[str, Any]) -> tuple[str
     Returns:
         Tuple of (calculated_value, reference_value)
     """
+    # A single os.stat is the only syscall needed: it both detects a missing
+    # file (OSError) and yields the size, with no separate is_file() probe.
     try:
-        file_size = filepath.stat().st_size
-        calculated_value = str(file_size)
-    except (FileNotFoundError, OSError):
+        calculated_value = str(os.stat(filepath).st_size)  # noqa: PTH116
+    except OSError:
         calculated_value = None
 
     reference_value = params["size"]
     return calculated_value, reference_value
 
 
-def handle_content_matches(lines: list[str], params: ChainMap[str, Any]) -> tuple[str | None, Any]:
+def handle_content_matches(lines: list[str], params: Mapping[str, Any]) -> tuple[str | None, Any]:
     """Handle content-based matches and return calculated and reference values.
 
     Supports pattern searching, line indexing, field extraction, column
@@ -177,19 +187,33 @@ def handle_content_matches(lines: list[str], params: ChainMap[str, Any]) -> tupl
     else:
         raise UsageError("Content-based match requires either 'grep' or 'line' parameter")
 
-    # Extract the value based on field, column, or field_re/field_im
+    return _extract_requested_value(line, params)
+
+
+def _extract_requested_value(line: str | None, params: Mapping[str, Any]) -> tuple[str | None, Any]:
+    """Extract the requested value from *line* and pair it with the reference.
+
+    Extraction is selected by the ``field``, ``column``, or
+    ``field_re``/``field_im`` parameters.
+
+    Raises:
+        UsageError: If no extraction parameter or no ``value`` is provided.
+    """
     if "field" in params:
         calculated_value = extract_field_from_line(line, params["field"])
     elif "column" in params:
         calculated_value = extract_column_from_line(line, params["column"])
     elif "field_re" in params and "field_im" in params:
-        real_field = extract_field_from_line(line, params["field_re"])
-        imag_field = extract_field_from_line(line, params["field_im"])
+        # Split once and index both components rather than re-tokenizing the
+        # line per field.
+        fields = line.split() if line is not None else None
+        real_field = extract_field(fields, params["field_re"])
+        imag_field = extract_field(fields, params["field_im"])
         if real_field is not None and imag_field is not None:
             try:
                 real_part = float(real_field)
                 imag_part = float(imag_field)
-                calculated_value = str(math.sqrt(real_part**2 + imag_part**2))
+                calculated_value = str(math.hypot(real_part, imag_part))
             except ValueError:
                 calculated_value = None
         else:
@@ -208,19 +232,201 @@ def handle_content_matches(lines: list[str], params: ChainMap[str, Any]) -> tupl
 # ---------------------------------------------------------------------------
 
 
-def _handle_content_from_file(filepath: Path, params: ChainMap[str, Any]) -> tuple[str | None, Any]:
+# Cache of fully read files keyed by path and validated by (st_mtime_ns,
+# st_size).  A config typically asserts many values against the same output
+# file, so one read is amortized across all of its matches.  Bounded FIFO:
+# insertion order is good enough given how few files a test touches.
+_CONTENT_CACHE: dict[str, tuple[tuple[int, int], list[str]]] = {}
+_CONTENT_CACHE_MAX = 64
+
+
+def _cached_lines(filepath: Path) -> list[str] | None:
+    """Return the cached line list for *filepath* if still valid, else None."""
+    key = os.fspath(filepath)
+    entry = _CONTENT_CACHE.get(key)
+    if entry is None:
+        return None
+    try:
+        st = filepath.stat()
+    except OSError:
+        return None
+    if entry[0] != (st.st_mtime_ns, st.st_size):
+        del _CONTENT_CACHE[key]
+        return None
+    return entry[1]
+
+
+def _store_lines(filepath: Path, lines: list[str]) -> None:
+    """Remember the line list for *filepath*, evicting the oldest entry."""
+    try:
+        st = filepath.stat()
+    except OSError:
+        return
+    if len(_CONTENT_CACHE) >= _CONTENT_CACHE_MAX:
+        _CONTENT_CACHE.pop(next(iter(_CONTENT_CACHE)))
+    _CONTENT_CACHE[os.fspath(filepath)] = ((st.st_mtime_ns, st.st_size), lines)
+
+
+@lru_cache(maxsize=256)
+def _encoded_needle(pattern: str) -> bytes:
+    """Return the UTF-8 encoding of *pattern*, cached across files.
+
+    The same grep pattern typically recurs for every output file in a
+    suite, so the encoding is paid once per distinct pattern.
+    """
+    return pattern.encode()
+
+
+def _count_matching_lines(filepath: Path, pattern: str) -> int:
+    """Count the lines in *filepath* that contain *pattern*.
+
+    The file is memory-mapped and scanned with byte-level ``find()``, so the
+    substring search runs inside libc instead of one Python comparison per
+    line.  After each hit the scan skips past the next newline, matching the
+    per-line ``pattern in line`` semantics exactly.
+    """
+    needle = _encoded_needle(pattern)
+    with filepath.open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped — and contain no matches.
+            return 0
+        with mapped:
+            count = 0
+            position = mapped.find(needle)
+            while position != -1:
+                count += 1
+                newline = mapped.find(b"\n", position + len(needle))
+                if newline == -1:
+                    break
+                position = mapped.find(needle, newline + 1)
+    return count
+
+
+def _grep_line_from_mmap(filepath: Path, pattern: str) -> str | None:
+    """Return the first line of *filepath* containing *pattern*, or ``None``.
+
+    The pattern is located with ``mmap.find()`` — a libc-level scan — and
+    only the matching line is sliced out and decoded, so the file is never
+    split into a Python line list.  The trailing newline is kept so the
+    result is exactly what ``readlines()`` would have produced.
+    """
+    needle = _encoded_needle(pattern)
+    with filepath.open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped — and contain no matches.
+            return None
+        with mapped:
+            position = mapped.find(needle)
+            if position == -1:
+                return None
+            start = mapped.rfind(b"\n", 0, position) + 1
+            end = mapped.find(b"\n", position)
+            raw = mapped[start:] if end == -1 else mapped[start : end + 1]
+    return raw.decode(errors="replace")
+
+
+def _line_from_end(filepath: Path, k: int) -> str | None:
+    """Return the *k*-th line from the end of *filepath* (1 = last line).
+
+    Walks newlines backwards through a memory map, so only the tail of the
+    file is touched — no full read and no line list.  Mirrors the indexing
+    of ``readlines()[-k]``: a trailing newline does not start an empty final
+    line, and the returned line keeps its terminator when it has one.
+    Returns ``None`` when the file holds fewer than *k* lines.
+    """
+    with filepath.open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped — and contain no lines.
+            return None
+        with mapped:
+            size = len(mapped)
+            end = size
+            # A trailing newline terminates the last line rather than
+            # starting an empty one, so it is excluded from the first search.
+            bound = size - 1 if mapped[size - 1 : size] == b"\n" else size
+            for i in range(k):
+                newline = mapped.rfind(b"\n", 0, bound)
+                start = newline + 1
+                if i == k - 1:
+                    return mapped[start:end].decode(errors="replace")
+                if newline == -1:
+                    return None
+                end = start
+                bound = newline
+    return None  # pragma: no cover — loop always returns for k >= 1
+
+
+def _handle_content_from_file(filepath: Path, params: Mapping[str, Any]) -> tuple[str | None, Any]:
     """Read *filepath* and delegate to :func:`handle_content_matches`.
 
+    Matches that only need a single pass or a single line avoid
+    materializing the full line list: grep counts and offset-free greps
+    scan a memory map, positive line indices stream up to the requested
+    line, and end-relative indices walk newlines backwards over a memory
+    map.  The remaining cases read the file once, keep the lines in
+    :data:`_CONTENT_CACHE` for the other matches against the same file,
+    and delegate.
+
     Returns ``(None, None)`` when the file cannot be read, which causes the
     top-level ``match()`` to report a failure.
     """
+    # Patterns containing a newline span lines, where the skip-past-newline
+    # loop would undercount; they take the generic per-line path below.
+    if "grep" in params and "count" in params and "\n" not in params["grep"]:
+        try:
+            return str(_count_matching_lines(filepath, params["grep"])), params["count"]
+        except (FileNotFoundError, OSError) as e:
+            logging.debug("   Error reading file %s: %s", filepath.name, e)
+            return None, None
+
+    # Greps without a line offset only need the matching line itself, so the
+    # pattern search can run over a memory map too.  Patterns containing a
+    # newline could span lines and take the generic path below.
+    if "grep" in params and params.get("line", 0) == 0 and "\n" not in params["grep"]:
+        try:
+            line = _grep_line_from_mmap(filepath, params["grep"])
+        except (FileNotFoundError, OSError) as e:
+            logging.debug("   Error reading file %s: %s", filepath.name, e)
+            return None, None
+        return _extract_requested_value(line, params)
+
+    cached = _cached_lines(filepath)
+    if cached is not None:
+        return handle_content_matches(cached, params)
+
+    # Plain line indexing never needs the whole file: positive indices
+    # stream up to the requested line, non-positive ones (counted from the
+    # end, matching get_target_line) walk newlines backwards over a memory
+    # map.  handle_content_matches maps "line" to index params["line"] - 1,
+    # so line <= 0 means the (1 - line)-th line from the end.
+    if "line" in params and "grep" not in params:
+        line_num = params["line"]
+        try:
+            if line_num >= 1:
+                with filepath.open("r", errors="replace") as f:
+                    return _extract_requested_value(next(islice(f, line_num - 1, line_num), None), params)
+            return _extract_requested_value(_line_from_end(filepath, 1 - line_num), params)
+        except (FileNotFoundError, OSError, UnicodeDecodeError) as e:
+            logging.debug("   Error reading file %s: %s", filepath.name, e)
+            return None, None
+
+    # One read into a single string plus one C-level splitlines beats
+    # readlines()'s incremental list construction.
     try:
         with filepath.open("r", errors="replace") as f:
-            lines = f.readlines()
+            content = f.read()
     except (FileNotFoundError, UnicodeDecodeError) as e:
-        logging.debug(f"   Error reading file {filepath.name}: {e}")
+        logging.debug("   Error reading file %s: %s", filepath.name, e)
         return None, None
 
+    lines = content.splitlines(keepends=True)
+    _store_lines(filepath, lines)
     return handle_content_matches(lines, params)
 
 
@@ -262,7 +468,7 @@ register_match_handler(
 # =============================================================================
 
 
-def match(name: str, params: ChainMap[str, Any], work_dir: Path, indent_level: int = 3) -> tuple[bool, str | None]:
+def match(name: str, params: Mapping[str, Any], work_dir: Path, indent_level: int = 3) -> tuple[bool, str | None]:
     """Execute a match operation and compare the result against the expected value.
 
     Routes to the appropriate registered handler based on the parameter keys.
@@ -276,16 +482,42 @@ def match(name: str, params: ChainMap[str, Any], work_dir: Path, indent_level: i
     Returns:
         Tuple of (success, calculated_value).
     """
-    # Determine the target path — directory parameter takes precedence over file
-    filepath = work_dir / params["directory"] if "directory" in params else work_dir / params["file"]
-
-    # Route to the first registered handler whose predicate matches
-    for predicate, handler in _MATCH_HANDLERS:
-        if predicate(params):
-            calculated_value, reference_value = handler(filepath, params)
-            break
+    # Runner passes a ChainMap layering match params over test defaults; every
+    # lookup on it walks the maps in order.  Flattening once up front means the
+    # handlers below do plain dict lookups (dict() honours ChainMap precedence).
+    if not isinstance(params, dict):
+        params = dict(params)
+
+    # Determine the target path — directory parameter takes precedence over
+    # file; handlers registered by extensions may use neither and receive the
+    # working directory itself.
+    if "directory" in params:
+        filepath = work_dir / params["directory"]
+    elif "file" in params:
+        filepath = work_dir / params["file"]
     else:
-        raise UsageError(f"No registered match handler for params: {dict(params)}")  # pragma: no cover
+        filepath = work_dir
+
+    # Fast-path dispatch on key presence for the built-in handlers.  This
+    # mirrors their registration order below, so the outcome is identical to
+    # the generic predicate scan, without one Python call per predicate.
+    if "directory" in params:
+        handler = handle_directory_matches
+    elif "file" in params:
+        handler = handle_file_matches if "size" in params else _handle_content_from_file
+    else:
+        handler = None
+
+    if handler is not None:
+        calculated_value, reference_value = handler(filepath, params)
+    else:
+        # Route to the first registered handler whose predicate matches
+        for predicate, handler in _MATCH_HANDLERS:
+            if predicate(params):
+                calculated_value, reference_value = handler(filepath, params)
+                break
+        else:
+            raise UsageError(f"No registered match handler for params: {params}")
 
     # Check if calculation succeeded
     if calculated_value is None:
@@ -80,9 +80,10 @@ class PseudoTestRunner:
                 else:
                     nested_level = indent_level
 
-                update_results: list[tuple[int, bool, str | None, Any]] = []
+                successes: list[bool] = []
+                calculated_values: list[str | None] = []
 
-                for i, param_set in enumerate(param_sets):
+                for param_set in param_sets:
                     self.total_matches += 1
                     display_name = param_set.get("match", match_name) if len(param_sets) > 1 else match_name
                     match_success, calculated_value = match(
@@ -91,10 +92,11 @@ class PseudoTestRunner:
                     if not match_success:
                         self.failed_matches += 1
                     results[display_name] = ReportWriter.build_match_entry(param_set, calculated_value)
-                    update_results.append((i, match_success, calculated_value, param_set))
+                    successes.append(match_success)
+                    calculated_values.append(calculated_value)
 
                 if self.update_mode and apply_match_updates(
-                    match_definition, update_results, len(param_sets), self.update_mode
+                    match_definition, successes, calculated_values, param_sets, self.update_mode
                 ):
                     self.config_modified = True
             else:
@@ -134,7 +136,8 @@ class PseudoTestRunner:
         # Load and validate test configuration
         test_config_file = Path(test_file_path)
         test_config = TestConfig()
-        test_config.load(test_config_file)
+        # Round-trip parsing is only needed when the config will be written back
+        test_config.load(test_config_file, round_trip=bool(update_mode))
 
         print(f"{self.colors.BLUE}***** {test_config.data['Name']} *****{self.colors.RESET}")
 
@@ -196,10 +199,10 @@ class PseudoTestRunner:
         print(f"{indent(1)}Failed matches    : {self.failed_matches:-5}")
 
         if preserve_workdir:
-            logging.debug(f"Preserved working directory: {temp_work_dir}")
+            logging.debug("Preserved working directory: %s", temp_work_dir)
         else:
             shutil.rmtree(temp_work_dir, ignore_errors=True)
-            logging.debug(f"Removed working directory: {temp_work_dir}")
+            logging.debug("Removed working directory: %s", temp_work_dir)
 
         exit_code = ExitCode.OK if (self.failed_executions == 0 and self.failed_matches == 0) else ExitCode.TEST_FAILURE
 
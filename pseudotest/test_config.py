@@ -13,6 +13,18 @@ try:
 except ImportError as e:  # pragma: no cover
     raise ImportError("ruamel.yaml not available. Install with: pip install ruamel.yaml") from e
 
+# Optional fast path: the libyaml-backed PyYAML loader is an order of magnitude
+# faster than the ruamel.yaml round-trip parser.  It is only usable when the
+# loaded data does not need to be written back with comments and formatting
+# preserved, i.e. outside of update mode.
+try:
+    import yaml as pyyaml
+
+    _FAST_LOADER = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
+except ImportError:  # pragma: no cover
+    pyyaml = None
+    _FAST_LOADER = None
+
 
 def broadcast_params(params: ChainMap[str, Any]) -> list[ChainMap[str, Any]]:
     """Broadcast parameters containing lists to multiple parameter sets"""
@@ -49,15 +61,25 @@ class TestConfig:
         """Initialize a new TestConfig instance"""
         self.data: dict[str, Any] = {}
 
-    def load(self, file: Path):
-        """Load configuration from a YAML file"""
+    def load(self, file: Path, round_trip: bool = True):
+        """Load configuration from a YAML file.
+
+        With ``round_trip=True`` (the default) the file is parsed with
+        ruamel.yaml so that comments and formatting survive a later
+        :func:`~pseudotest.config_updater.save_config`.  Pass
+        ``round_trip=False`` for read-only loads to use the much faster
+        libyaml-backed PyYAML parser when it is available.
+        """
 
         # Load YAML test file
         if not file.is_file():
             raise FileNotFoundError(f"Test file not found: {file}")
         try:
             with file.open() as f:
-                self.data = yaml.load(f)
+                if round_trip or _FAST_LOADER is None:
+                    self.data = yaml.load(f)
+                else:
+                    self.data = pyyaml.load(f, Loader=_FAST_LOADER)
         except Exception as e:
             raise ValueError(f"Failed to load test file: {e}") from e
 
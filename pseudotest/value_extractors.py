@@ -25,14 +25,12 @@ def get_target_line(lines: list[str], line_num: int) -> str | None:
         >>> get_target_line(lines, 0)   # "first"
         >>> get_target_line(lines, -1)  # "third"
     """
-    if line_num >= 0:
-        if line_num >= len(lines):
-            return None
-        return lines[line_num]
-    else:
-        if abs(line_num) > len(lines):
-            return None
+    # Python's native negative indexing already handles both directions, so
+    # a single range check is all that is needed.
+    n = len(lines)
+    if -n <= line_num < n:
         return lines[line_num]
+    return None
 
 
 def find_pattern_line(lines: list[str], pattern: str, offset: int = 0) -> str | None:
@@ -67,6 +65,25 @@ def find_pattern_line(lines: list[str], pattern: str, offset: int = 0) -> str |
     return None
 
 
+def extract_field(fields: list[str] | None, field_num: int) -> str | None:
+    """Return the 1-indexed *field_num* entry of a pre-split token list.
+
+    Companion to :func:`extract_field_from_line` for callers that already
+    hold the tokens and want to avoid re-splitting the same line per field.
+
+    Args:
+        fields: Whitespace-split line content, or None if the line doesn't exist
+        field_num: 1-indexed field position
+
+    Returns:
+        Content of the specified field as string, or None if fields is None
+        or field number is out of bounds
+    """
+    if fields is None or field_num < 1 or field_num > len(fields):
+        return None
+    return fields[field_num - 1]
+
+
 def extract_field_from_line(line: str | None, field_num: int) -> str | None:
     """Extract a specific whitespace-separated field from a line.
 
@@ -89,10 +106,11 @@ def extract_field_from_line(line: str | None, field_num: int) -> str | None:
     if line is None:
         return None
 
-    fields = line.split()
-    if field_num < 1 or field_num > len(fields):
-        return None
-    return fields[field_num - 1]
+    # Bounding the split stops the scan once the requested field has been
+    # tokenized, so the tail of a wide line is never materialized.  At most
+    # one extra element (the untokenized remainder) is produced, and it sits
+    # past the index extract_field reads.
+    return extract_field(line.split(None, field_num), field_num)
 
 
 def extract_column_from_line(line: str | None, column_pos: int) -> str | None:
@@ -124,9 +142,7 @@ def extract_column_from_line(line: str | None, column_pos: int) -> str | None:
     if column_pos > len(line):
         return None
 
-    # Extract substring from column position onwards
-    substring = line[column_pos - 1 :].lstrip()
-
-    # Get first whitespace-separated token
-    tokens = substring.split()
+    # A bounded split skips leading whitespace and stops at the first break,
+    # instead of stripping and tokenizing the whole remainder of the line.
+    tokens = line[column_pos - 1 :].split(None, 1)
     return tokens[0] if tokens else ""
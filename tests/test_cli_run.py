@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 import pseudotest
-import pseudotest.cli_run
+import pseudotest.runner
 
 
 class TestPackageMain:
@@ -12,8 +12,9 @@ class TestPackageMain:
     def test_package_main_with_mock_runner(self):
         """Calling pseudotest.main() delegates to cli_run.main() and creates a PseudoTestRunner."""
         mock_run = MagicMock(return_value=0)
+        # cli_run imports the runner lazily, so patch it at the source module
         with patch.object(
-            pseudotest.cli_run,
+            pseudotest.runner,
             "PseudoTestRunner",
             lambda: type("R", (), {"run": mock_run})(),
         ):
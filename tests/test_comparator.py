@@ -22,6 +22,11 @@ class TestIsNumber:
     def test_none(self):
         assert is_number(None) is False
 
+    def test_unhashable_input(self):
+        """Unhashable values must return False, not trip over the cache."""
+        assert is_number([1, 2]) is False
+        assert is_number({"a": 1}) is False
+
 
 # ---------------------------------------------------------------------------
 # match_compare_result
@@ -55,6 +60,15 @@ class TestGetPrecision:
     def test_non_numeric_string(self):
         assert get_precision_from_string_format("abc") == 0.0
 
+    def test_empty_string(self):
+        assert get_precision_from_string_format("") == 0.0
+
+    def test_invalid_exponent(self):
+        assert get_precision_from_string_format("1.5e+") == 0.0
+
+    def test_invalid_mantissa(self):
+        assert get_precision_from_string_format("1.2.3") == 0.0
+
     def test_scientific_notation_with_decimal(self):
         p = get_precision_from_string_format("1.23e+02")
         assert abs(p - 1.0) < 1e-12  # 0.01 * 100 = 1.0
@@ -91,3 +105,19 @@ class TestStringComparison:
     def test_string_match(self):
         result = match_compare_result("status", "converged", "converged")
         assert result is True
+
+
+# ---------------------------------------------------------------------------
+# Quiet mode
+# ---------------------------------------------------------------------------
+
+
+class TestQuietMode:
+    def test_quiet_suppresses_passing_status(self, capsys):
+        assert match_compare_result("quiet_eq", "1.0", 1.0, quiet=True) is True
+        assert match_compare_result("quiet_tol", "1.01", 1.0, tolerance=0.1, quiet=True) is True
+        assert capsys.readouterr().out == ""
+
+    def test_quiet_still_reports_failures(self, capsys):
+        assert match_compare_result("quiet_fail", "2.0", 1.0, quiet=True) is False
+        assert "FAIL" in capsys.readouterr().out
@@ -1,6 +1,10 @@
 """Unit tests for pseudotest.config_updater."""
 
+from ruamel.yaml.scalarfloat import ScalarFloat
+
 from pseudotest.config_updater import (
+    _TEMPLATE_FMT_CACHE,
+    _TEMPLATE_FMT_CACHE_MAX,
     _cast_to_reference_type,
     _update_reference,
     _update_tolerance,
@@ -16,6 +20,11 @@ class TestComputeTolerance:
         tol = compute_tolerance(0.0034)
         assert tol > 0.0034
 
+    def test_magnitude_outside_table_range(self):
+        """Magnitudes beyond the precomputed table fall back to log10."""
+        tol = compute_tolerance(1e-40)
+        assert tol > 1e-40
+
 
 class TestCastToReferenceType:
     def test_successful_int_cast(self):
@@ -38,6 +47,24 @@ class TestCastToReferenceType:
         assert result == "anything"
         assert isinstance(result, str)
 
+    def test_scalar_float_template_format_reused(self):
+        """Casting twice against the same template hits the format cache."""
+        template = ScalarFloat(1.23, width=4, prec=1)
+        first = _cast_to_reference_type("4.56", template)
+        second = _cast_to_reference_type("7.89", template)
+        assert float(first) == 4.56
+        assert float(second) == 7.89
+        # The entry pins the template so its id cannot be recycled
+        assert _TEMPLATE_FMT_CACHE[id(template)][0] is template
+
+    def test_template_format_cache_is_bounded(self):
+        """Filling the cache past its limit evicts the oldest entry."""
+        templates = [ScalarFloat(1.5, width=4, prec=1) for _ in range(_TEMPLATE_FMT_CACHE_MAX + 1)]
+        for template in templates:
+            _cast_to_reference_type("2.5", template)
+        assert len(_TEMPLATE_FMT_CACHE) <= _TEMPLATE_FMT_CACHE_MAX
+        assert id(templates[-1]) in _TEMPLATE_FMT_CACHE
+
 
 class TestUpdateTolerance:
     def test_no_reference_key_returns_false(self):
@@ -52,12 +79,18 @@ class TestUpdateTolerance:
         param_set = {"value": "text"}
         assert _update_tolerance(match_def, 0, 1, "also_text", param_set) is False
 
-    def test_zero_difference_returns_false(self):
-        """Calculated equals reference → difference is 0 → returns False."""
+    def test_equal_strings_return_false(self):
+        """Calculated equals reference as strings → returns False early."""
         match_def = {}
         param_set = {"value": 42.0}
         assert _update_tolerance(match_def, 0, 1, "42.0", param_set) is False
 
+    def test_zero_difference_returns_false(self):
+        """Calculated parses to the reference value → difference is 0 → returns False."""
+        match_def = {}
+        param_set = {"value": 42.0}
+        assert _update_tolerance(match_def, 0, 1, "42.00", param_set) is False
+
     def test_broadcast_scalar_tol_converted_to_list(self):
         """Existing scalar tol should be expanded to a list for broadcast."""
         match_def = {"value": [1.0, 2.0], "tol": 0.01}
@@ -1,5 +1,6 @@
 """Unit tests for pseudotest.executor."""
 
+import logging
 import os
 import stat
 from collections import ChainMap
@@ -40,6 +41,41 @@ class TestResolveExecutable:
         result = TestExecutor._resolve_executable(config, tmp_path)
         assert result.name == "good.py"
 
+    def test_resolution_is_cached(self, tmp_path):
+        """Repeat resolutions skip the stat checks until the cache is cleared."""
+        from pseudotest.executor import _resolve_executable_cached
+
+        script = tmp_path / "good.py"
+        script.write_text("#!/usr/bin/env python3\n")
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+        config = ChainMap({"Executable": "good.py"})
+        first = TestExecutor._resolve_executable(config, tmp_path)
+        script.unlink()
+        # Still resolvable from the cache despite the file being gone
+        assert TestExecutor._resolve_executable(config, tmp_path) == first
+
+        _resolve_executable_cached.cache_clear()
+        with pytest.raises(FileNotFoundError, match="not available"):
+            TestExecutor._resolve_executable(config, tmp_path)
+
+    def test_fadvise_failure_is_ignored(self, tmp_path, monkeypatch):
+        """The page-cache hint is advisory; errors must not break resolution."""
+        from pseudotest.executor import _resolve_executable_cached
+
+        script = tmp_path / "good.py"
+        script.write_text("#!/usr/bin/env python3\n")
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+        def exploding_fadvise(*args):
+            raise OSError("Simulated fadvise failure")
+
+        monkeypatch.setattr(os, "posix_fadvise", exploding_fadvise)
+        _resolve_executable_cached.cache_clear()
+        config = ChainMap({"Executable": "good.py"})
+        result = TestExecutor._resolve_executable(config, tmp_path)
+        assert result.name == "good.py"
+
 
 # ---------------------------------------------------------------------------
 # _prepare_files
@@ -79,6 +115,24 @@ class TestPrepareFiles:
         assert name == "input.txt"
         assert (work_dir / "input.txt").exists()
 
+    def test_missing_test_dir(self, tmp_path):
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        with pytest.raises(FileNotFoundError, match="Input file not found"):
+            TestExecutor._prepare_files(Path("input.txt"), tmp_path / "gone", work_dir, [], "argument", None)
+
+    def test_input_file_in_subdirectory(self, tmp_path):
+        """Files outside the scandir snapshot fall back to an exists() probe."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "input.txt").write_text("data\n")
+
+        name = TestExecutor._prepare_files(Path("sub/input.txt"), tmp_path, work_dir, [], "argument", None)
+        assert name == "sub/input.txt"
+        assert (work_dir / "input.txt").exists()
+
     def test_extra_files_copied(self, tmp_path):
         work_dir = tmp_path / "work"
         work_dir.mkdir()
@@ -98,21 +152,21 @@ class TestBuildCommand:
     def test_argument_method(self, tmp_path):
         exe = tmp_path / "prog"
         args, stdin = TestExecutor._build_command(exe, "input.txt", "argument", tmp_path)
-        assert args == [exe, "input.txt"]
+        assert args == [str(exe), "input.txt"]
         assert stdin is None
 
     def test_stdin_method(self, tmp_path):
         exe = tmp_path / "prog"
         (tmp_path / "input.txt").write_text("data\n")
         args, stdin = TestExecutor._build_command(exe, "input.txt", "stdin", tmp_path)
-        assert args == [exe]
-        assert stdin is not None
-        stdin.close()
+        assert args == [str(exe)]
+        assert isinstance(stdin, int)
+        os.close(stdin)
 
     def test_rename_method(self, tmp_path):
         exe = tmp_path / "prog"
         args, stdin = TestExecutor._build_command(exe, "inp.dat", "rename", tmp_path)
-        assert args == [exe]
+        assert args == [str(exe)]
         assert stdin is None
 
     def test_unknown_method_raises(self, tmp_path):
@@ -192,3 +246,156 @@ class TestRunSubprocess:
             )
         assert success is False
         assert elapsed >= 0.0
+
+    def test_stdout_fd_closed_when_stderr_open_fails(self, tmp_path):
+        """A failed stderr open must not leak the already-open stdout fd."""
+        opened_fds = []
+        real_open = os.open
+
+        def failing_open(path, *args, **kwargs):
+            if str(path).endswith("stderr"):
+                raise OSError("Simulated open failure")
+            fd = real_open(path, *args, **kwargs)
+            opened_fds.append(fd)
+            return fd
+
+        with patch.object(os, "open", failing_open), pytest.raises(OSError, match="Simulated"):
+            TestExecutor._launch(["true"], str(tmp_path), None, 30)
+
+        assert opened_fds
+        for fd in opened_fds:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+
+    def test_stderr_logged_at_debug_on_success(self, tmp_path, caplog):
+        """A passing run with stderr output re-reads it only for DEBUG logging."""
+        exe = tmp_path / "prog"
+        exe.write_text("#!/bin/sh\necho warning >&2\n")
+        exe.chmod(exe.stat().st_mode | stat.S_IXUSR)
+
+        executor = TestExecutor()
+        with caplog.at_level(logging.DEBUG):
+            success, _ = executor._run_subprocess(
+                [str(exe)],
+                None,
+                tmp_path,
+                "input.txt",
+                Path("input.txt"),
+                False,
+                30,
+            )
+        assert success is True
+        assert "STDERR: warning" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# execute_many — parallel execution over a persistent worker pool
+# ---------------------------------------------------------------------------
+
+
+class TestExecuteMany:
+    @staticmethod
+    def _make_request(tmp_path, index):
+        """Build one execute() argument tuple backed by a trivial script."""
+        exe = tmp_path / "prog"
+        if not exe.exists():
+            exe.write_text("#!/bin/sh\necho ok\n")
+            exe.chmod(exe.stat().st_mode | stat.S_IXUSR)
+        (tmp_path / f"input{index}.txt").write_text("data\n")
+        work_dir = tmp_path / f"work{index}"
+        work_dir.mkdir()
+        config = ChainMap({"Executable": "prog"})
+        return (config, Path(f"input{index}.txt"), tmp_path, tmp_path, work_dir, False, 30)
+
+    def test_run_one_executes_request(self, tmp_path):
+        """_run_one is the picklable worker entry point; exercise it directly."""
+        from pseudotest.executor import _run_one
+
+        input_file, success, elapsed = _run_one(self._make_request(tmp_path, 0))
+        assert input_file == Path("input0.txt")
+        assert success is True
+        assert elapsed >= 0.0
+
+    def test_parallel_execution_reuses_pool(self, tmp_path):
+        executor = TestExecutor()
+        requests = [self._make_request(tmp_path, i) for i in range(1, 3)]
+        try:
+            results = executor.execute_many(requests)
+            pool = executor._pool
+            assert pool is not None
+            # A second call reuses the same pool
+            (tmp_path / "work3").mkdir()
+            request = (
+                ChainMap({"Executable": "prog"}),
+                Path("input1.txt"),
+                tmp_path,
+                tmp_path,
+                tmp_path / "work3",
+                False,
+                30,
+            )
+            more = executor.execute_many([request])
+            assert executor._pool is pool
+        finally:
+            executor.close()
+        assert executor._pool is None
+        assert {r[0] for r in results} == {Path("input1.txt"), Path("input2.txt")}
+        assert all(r[1] for r in results)
+        assert more[0][1] is True
+
+    def test_close_without_pool_is_noop(self):
+        executor = TestExecutor()
+        executor.close()
+        assert executor._pool is None
+
+
+# ---------------------------------------------------------------------------
+# _copy_file
+# ---------------------------------------------------------------------------
+
+
+class TestCopyFile:
+    def test_kernel_copy(self, tmp_path):
+        from pseudotest.executor import _copy_file
+
+        src = tmp_path / "src.dat"
+        src.write_bytes(b"payload" * 100)
+        dest = tmp_path / "dest.dat"
+        _copy_file(src, dest)
+        assert dest.read_bytes() == src.read_bytes()
+
+    def test_fallback_when_unavailable(self, tmp_path, monkeypatch):
+        """Without copy_file_range the copy goes through shutil.copyfile."""
+        import pseudotest.executor as executor_module
+
+        monkeypatch.setattr(executor_module, "_HAS_COPY_FILE_RANGE", False)
+        src = tmp_path / "src.dat"
+        src.write_bytes(b"payload")
+        dest = tmp_path / "dest.dat"
+        executor_module._copy_file(src, dest)
+        assert dest.read_bytes() == b"payload"
+
+    def test_fallback_on_oserror(self, tmp_path, monkeypatch):
+        """EXDEV/EOPNOTSUPP-style failures fall back to the userspace copy."""
+        from pseudotest.executor import _copy_file
+
+        def exploding_copy_file_range(*args):
+            raise OSError("Simulated EXDEV")
+
+        monkeypatch.setattr(os, "copy_file_range", exploding_copy_file_range)
+        src = tmp_path / "src.dat"
+        src.write_bytes(b"payload")
+        dest = tmp_path / "dest.dat"
+        _copy_file(src, dest)
+        assert dest.read_bytes() == b"payload"
+
+    def test_fallback_on_short_copy(self, tmp_path, monkeypatch):
+        """A zero-byte return means no progress; fall back to copyfile."""
+        from pseudotest.executor import _copy_file
+
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0)
+        src = tmp_path / "src.dat"
+        src.write_bytes(b"payload")
+        dest = tmp_path / "dest.dat"
+        _copy_file(src, dest)
+        assert dest.read_bytes() == b"payload"
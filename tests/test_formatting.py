@@ -4,7 +4,8 @@ import io
 from pathlib import PosixPath
 from unittest.mock import patch
 
-from pseudotest.formatting import Colors, OutputFormatter
+import pseudotest.formatting
+from pseudotest.formatting import Colors, OutputFormatter, reset_colors
 
 
 class TestColorsTTY:
@@ -19,6 +20,18 @@ class TestColorsTTY:
         assert c.GREEN == "\033[32m"
         assert c.RESET == "\033[0m"
 
+    def test_reset_colors_redetects_tty(self):
+        """reset_colors() refreshes the shared instance from the current stdout."""
+        fake_tty = io.StringIO()
+        fake_tty.isatty = lambda: True
+        try:
+            with patch("sys.stdout", fake_tty):
+                reset_colors()
+                assert pseudotest.formatting._COLORS.GREEN == "\033[32m"
+        finally:
+            reset_colors()
+        assert pseudotest.formatting._COLORS.GREEN == ""
+
 
 class TestPrintExecutionOutput:
     """Directly call OutputFormatter.print_execution_output to cover edge-case branches."""
@@ -126,6 +126,15 @@ class TestHandleDirectoryMatches:
         calc, ref = handle_directory_matches(d, params)
         assert calc == "True"
 
+    def test_file_is_present_nested(self, tmp_path):
+        """Targets in subdirectories fall back to a direct is_file() probe."""
+        d = tmp_path / "output"
+        (d / "sub").mkdir(parents=True)
+        (d / "sub" / "data.txt").write_text("ok\n")
+        params = ChainMap({"file_is_present": "sub/data.txt"})
+        calc, ref = handle_directory_matches(d, params)
+        assert calc == "True"
+
     def test_file_is_present_missing(self, tmp_path):
         d = tmp_path / "output"
         d.mkdir()
@@ -192,6 +201,157 @@ class TestHandleContentFromFile:
         assert calc is None
         assert ref is None
 
+    def test_grep_count_scans_mmap(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("WARNING: a\nok\nWARNING: b\n")
+        params = ChainMap({"grep": "WARNING", "count": 2})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "2"
+        assert ref == 2
+
+    def test_grep_count_counts_lines_not_occurrences(self, tmp_path):
+        """Two hits on one line count once, matching the per-line semantics."""
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("WARNING WARNING\nok\n")
+        params = ChainMap({"grep": "WARNING", "count": 1})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "1"
+
+    def test_grep_count_no_trailing_newline(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("ok\nWARNING: last")
+        params = ChainMap({"grep": "WARNING", "count": 1})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "1"
+
+    def test_grep_count_empty_file(self, tmp_path):
+        """Zero-length files cannot be memory-mapped; the count is simply 0."""
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("")
+        params = ChainMap({"grep": "WARNING", "count": 0})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "0"
+
+    def test_grep_count_newline_pattern_takes_line_path(self, tmp_path):
+        """Patterns spanning lines bypass the mmap count and keep per-line semantics."""
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("foo\nfoo\nbar\n")
+        params = ChainMap({"grep": "foo\n", "count": 2})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "2"
+        assert ref == 2
+
+    def test_grep_count_missing_file(self, tmp_path):
+        filepath = tmp_path / "nonexistent.txt"
+        params = ChainMap({"grep": "WARNING", "count": 0})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+        assert ref is None
+
+    def test_positive_line_streams_file(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2\nthird 3\n")
+        params = ChainMap({"line": 2, "field": 2, "value": 2})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "2"
+        assert ref == 2
+
+    def test_grep_field_via_mmap(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("Energy: -42.5 Ry\nTotal force: 1.2e-03 Ha\n")
+        params = ChainMap({"grep": "Total force:", "field": 3, "value": "1.2e-03"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "1.2e-03"
+        assert ref == "1.2e-03"
+
+    def test_grep_pattern_not_found(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("Energy: -42.5 Ry\n")
+        params = ChainMap({"grep": "Missing", "field": 1, "value": "x"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+
+    def test_grep_empty_file(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("")
+        params = ChainMap({"grep": "Energy:", "field": 1, "value": "x"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+
+    def test_grep_last_line_no_newline(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first\nEnergy: -42.5")
+        params = ChainMap({"grep": "Energy:", "field": 2, "value": -42.5})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "-42.5"
+
+    def test_grep_missing_file_returns_none(self, tmp_path):
+        filepath = tmp_path / "nonexistent.txt"
+        params = ChainMap({"grep": "Energy:", "field": 1, "value": "x"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+        assert ref is None
+
+    def test_grep_with_offset_uses_generic_path(self, tmp_path):
+        """A line offset needs neighbouring lines, so the full read applies."""
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("Energy: -42.5 Ry\nTotal force: 1.2e-03 Ha\n")
+        params = ChainMap({"grep": "Energy:", "line": 1, "field": 3, "value": "1.2e-03"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "1.2e-03"
+
+    def test_negative_line_reads_tail(self, tmp_path):
+        """line: -1 maps to index -2, i.e. the second-to-last line."""
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2\nthird 3\n")
+        params = ChainMap({"line": -1, "field": 2, "value": 2})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "2"
+        assert ref == 2
+
+    def test_line_zero_reads_last_line(self, tmp_path):
+        """line: 0 maps to index -1, the last line."""
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2\nthird 3\n")
+        params = ChainMap({"line": 0, "field": 2, "value": 3})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "3"
+
+    def test_last_line_without_trailing_newline(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2")
+        params = ChainMap({"line": 0, "field": 2, "value": 2})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "2"
+
+    def test_negative_line_out_of_bounds(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("only 1\n")
+        params = ChainMap({"line": -5, "field": 2, "value": 1})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+
+    def test_negative_line_single_line_file(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("only 1\n")
+        params = ChainMap({"line": 0, "field": 2, "value": 1})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc == "1"
+
+    def test_negative_line_empty_file(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("")
+        params = ChainMap({"line": 0, "field": 1, "value": "x"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+
+    def test_negative_line_missing_file(self, tmp_path):
+        filepath = tmp_path / "nonexistent.txt"
+        params = ChainMap({"line": 0, "field": 1, "value": "x"})
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+        assert ref is None
+
 
 # ---------------------------------------------------------------------------
 # match() dispatch — verify the top-level router works
@@ -223,3 +383,97 @@ class TestMatchDispatch:
         params = ChainMap({"file": "data.bin", "size": 50})
         success, calc = match("sz", params, tmp_path)
         assert success is True
+
+    def test_registered_handler_reached_via_predicate_scan(self, tmp_path):
+        """Custom handlers without 'file'/'directory' go through the generic scan."""
+        from pseudotest import matchers
+
+        def answer_handler(_path, params):
+            return "42", params["answer"]
+
+        matchers.register_match_handler(
+            predicate=lambda params: "answer" in params,
+            handler=answer_handler,
+            keys={"answer"},
+            reference_keys={"answer"},
+        )
+        try:
+            success, calc = match("custom", ChainMap({"answer": "42"}), tmp_path)
+        finally:
+            matchers._MATCH_HANDLERS.pop()
+            matchers.RESERVED_KEYS.discard("answer")
+            matchers.REFERENCE_KEYS.discard("answer")
+        assert success is True
+        assert calc == "42"
+
+    def test_unhandled_params_raise(self, tmp_path):
+        with pytest.raises(UsageError, match="No registered match handler"):
+            match("nohandler", ChainMap({"protected": True}), tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# _CONTENT_CACHE — amortizing reads across matches on the same file
+# ---------------------------------------------------------------------------
+
+
+class TestContentCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from pseudotest import matchers
+
+        matchers._CONTENT_CACHE.clear()
+        yield
+        matchers._CONTENT_CACHE.clear()
+
+    def test_repeat_reads_come_from_cache(self, tmp_path):
+        from pseudotest import matchers
+
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2\nthird 3\n")
+        params = ChainMap({"grep": "first", "line": 1, "field": 2, "value": 2})
+        _handle_content_from_file(filepath, params)
+
+        # Doctor the cached lines (keeping the validation token) to prove the
+        # second call is served from the cache rather than the file.
+        key = str(filepath)
+        token, _ = matchers._CONTENT_CACHE[key]
+        matchers._CONTENT_CACHE[key] = (token, ["first 1\n", "doctored 9\n"])
+        calc, _ = _handle_content_from_file(filepath, params)
+        assert calc == "9"
+
+    def test_modified_file_invalidates(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2\nthird 3\n")
+        params = ChainMap({"grep": "first", "line": 1, "field": 2, "value": 2})
+        calc, _ = _handle_content_from_file(filepath, params)
+        assert calc == "2"
+
+        filepath.write_text("first 1\nchanged 9\nthird 3\n")
+        calc, _ = _handle_content_from_file(filepath, params)
+        assert calc == "9"
+
+    def test_cached_entry_for_deleted_file(self, tmp_path):
+        filepath = tmp_path / "out.txt"
+        filepath.write_text("first 1\nsecond 2\n")
+        params = ChainMap({"grep": "first", "line": 1, "field": 2, "value": 2})
+        _handle_content_from_file(filepath, params)
+
+        filepath.unlink()
+        calc, ref = _handle_content_from_file(filepath, params)
+        assert calc is None
+        assert ref is None
+
+    def test_store_missing_file_is_noop(self, tmp_path):
+        from pseudotest.matchers import _CONTENT_CACHE, _store_lines
+
+        _store_lines(tmp_path / "gone.txt", ["x\n"])
+        assert str(tmp_path / "gone.txt") not in _CONTENT_CACHE
+
+    def test_eviction_keeps_cache_bounded(self, tmp_path):
+        from pseudotest import matchers
+
+        for i in range(matchers._CONTENT_CACHE_MAX + 5):
+            filepath = tmp_path / f"out{i}.txt"
+            filepath.write_text(f"value {i}\n")
+            matchers._store_lines(filepath, [f"value {i}\n"])
+        assert len(matchers._CONTENT_CACHE) <= matchers._CONTENT_CACHE_MAX
@@ -2,6 +2,7 @@
 
 from pseudotest.value_extractors import (
     extract_column_from_line,
+    extract_field,
     extract_field_from_line,
     find_pattern_line,
     get_target_line,
@@ -29,6 +30,17 @@ class TestFindPatternLine:
         assert find_pattern_line(["a", "b"], "z") is None
 
 
+class TestExtractField:
+    def test_none_fields(self):
+        assert extract_field(None, 1) is None
+
+    def test_out_of_bounds(self):
+        assert extract_field(["one", "two"], 5) is None
+
+    def test_in_bounds(self):
+        assert extract_field(["one", "two"], 2) == "two"
+
+
 class TestExtractFieldFromLine:
     def test_none_line(self):
         assert extract_field_from_line(None, 1) is None